@@ -2,8 +2,26 @@
 Configuración para el procesador de resúmenes de tarjeta
 """
 import os
+import re
+from dataclasses import dataclass
 from pathlib import Path
 
+
+@dataclass(frozen=True, slots=True)
+class FixedPositions:
+    """
+    Posiciones fijas de columnas de una línea de movimiento.
+    Dataclass congelada con slots: el parser la consulta por cada línea y
+    el acceso por atributo evita el doble lookup de dict del formato anterior.
+    """
+    fecha_start: int = 7
+    fecha_end: int = 15
+    comprobante_start: int = 20
+    descripcion_start: int = 31
+    min_amount_pos: int = 80
+    min_line_length: int = 103
+    max_line_length: int = 124
+
 # Configuración de directorios
 BASE_DIR = Path(__file__).parent
 OUTPUT_DIR = BASE_DIR / "output"
@@ -109,6 +127,58 @@ BANK_CONFIGS = {
     }
 }
 
+# Precompilar los patrones de BANK_CONFIGS una sola vez al importar.
+# Los extractores matchean estos patrones contra cada movimiento/línea;
+# compilarlos acá evita que cada consumidor recompile en cada uso.
+for _bank in BANK_CONFIGS.values():
+    for _key in ('saldo_patterns', 'cargos_patterns',
+                 'movement_section_start', 'movement_section_end'):
+        if _key in _bank:
+            _bank[_key] = [re.compile(_p) for _p in _bank[_key]]
+    for _key in ('pattern', 'filename_date_pattern'):
+        if _key in _bank:
+            _bank[_key] = re.compile(_bank[_key])
+    if 'fixed_positions' in _bank:
+        _bank['fixed_positions'] = FixedPositions(**_bank['fixed_positions'])
+del _bank, _key
+
+
+class _FilenameDateExtractor:
+    """
+    Extractor de fecha de nombre de archivo especializado por banco.
+    Resuelve los índices de grupo y el mapeo de meses una sola vez al
+    construirse, en lugar de indexar la configuración en cada archivo.
+    Es una clase a nivel de módulo (no una closure) para que la config
+    siga siendo picklable y los extractores puedan cruzar procesos.
+    """
+    __slots__ = ('pattern', 'day_group', 'month_group', 'year_group', 'month_map')
+
+    def __init__(self, pattern, groups, month_map):
+        self.pattern = pattern
+        self.day_group = groups['day']
+        self.month_group = groups['month']
+        self.year_group = groups['year']
+        self.month_map = month_map
+
+    def __call__(self, filename: str):
+        match = self.pattern.search(filename)
+        if not match:
+            return None
+        month = match.group(self.month_group)
+        month = self.month_map.get(month.lower(), month).zfill(2)
+        return f"{match.group(self.year_group)}-{month}-{match.group(self.day_group).zfill(2)}"
+
+
+# Extractor de fecha por banco, especializado al cargar el módulo
+for _bank in BANK_CONFIGS.values():
+    if 'filename_date_pattern' in _bank and 'filename_date_groups' in _bank:
+        _bank['extract_date_from_filename'] = _FilenameDateExtractor(
+            _bank['filename_date_pattern'],
+            _bank['filename_date_groups'],
+            _bank.get('month_mapping', {}),
+        )
+del _bank
+
 # Configuración de logging
 LOG_LEVEL = "INFO"
 LOG_FILE = OUTPUT_DIR / "procesamiento.log"
@@ -116,6 +186,11 @@ LOG_FILE = OUTPUT_DIR / "procesamiento.log"
 # Modo debug - muestra logs detallados del flujo de extracción
 DEBUG_MODE = False  # Cambiar a True para ver logs detallados de BaseExtractor, TextBasedExtractor, etc.
 
+# Cache en disco del texto extraído de cada PDF, clave (nombre, mtime, tamaño).
+# Útil en desarrollo: re-procesar los mismos PDFs se saltea pdfplumber por completo.
+TEXT_CACHE_ENABLED = False  # Cambiar a True para reutilizar el texto extraído entre corridas
+TEXT_CACHE_DIR = OUTPUT_DIR / ".text_cache"
+
 # Configuración de fecha
 DATE_FORMATS = [
     "%d/%m/%Y",
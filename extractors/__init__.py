@@ -1,6 +1,8 @@
 """
 Módulo de extractores para diferentes bancos
 """
+import functools
+
 from .patagonia import PatagoniaExtractor
 
 # Registro de extractores disponibles
@@ -11,9 +13,15 @@ EXTRACTORS = {
     # 'galicia': GaliciaExtractor,
 }
 
+@functools.lru_cache(maxsize=None)
 def get_extractor(bank_name: str):
     """
     Obtiene el extractor correspondiente para un banco
+
+    Memoizado: se reutiliza una única instancia por banco en lugar de
+    reconstruir el extractor (config, patrones compilados) por cada PDF.
+    Los extractores no guardan estado entre archivos, así que compartir
+    la instancia es seguro.
     """
     extractor_class = EXTRACTORS.get(bank_name.lower())
     if extractor_class:
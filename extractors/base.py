@@ -3,16 +3,226 @@ Clase base para extractores de resúmenes de tarjeta de crédito
 Proporciona funcionalidad común para todos los extractores específicos de bancos
 """
 import re
+import os
+import functools
 import pdfplumber
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
 from typing import List, Dict, Optional
 from pathlib import Path
 from datetime import datetime
 import logging
-from utils import parse_date, clean_description, debug_log, warning_log, extract_amount
-from config import DEBUG_MODE
+import hashlib
+from utils import clean_description, debug_log, warning_log, extract_amount
+from config import DEBUG_MODE, TEXT_CACHE_ENABLED, TEXT_CACHE_DIR, FixedPositions
 
 logger = logging.getLogger(__name__)
 
+# Columnas de un movimiento, en el orden en que se construyen
+_MOVEMENT_COLUMNS = ('fecha', 'comprobante', 'descripcion', 'importe',
+                     'cuota', 'moneda', 'titular', 'archivo_origen', 'banco')
+
+
+@dataclass(slots=True)
+class Movement:
+    """
+    Movimiento de un resumen de tarjeta de crédito
+
+    Dataclass con slots en lugar del dict por fila anterior: baja la
+    memoria por movimiento a una fracción y reemplaza los lookups por
+    hash de mov['campo'] por accesos de atributo que CPython especializa.
+    Las líneas de resumen por titular se representan como
+    pseudo-movimientos con solo el campo titular seteado.
+    """
+    fecha: Optional[datetime] = None
+    comprobante: str = ""
+    descripcion: str = ""
+    importe: Optional[float] = 0.0
+    cuota: str = ""
+    moneda: str = ""
+    titular: str = ""
+    archivo_origen: str = ""
+    banco: str = ""
+
+# Patrones precompilados una sola vez al cargar el módulo.
+# re.search/re.match con strings recompilan (o buscan en el cache interno de re)
+# en cada llamada; con miles de líneas por PDF ese overhead domina.
+_MONTO_STR = r'\d{1,3}(?:\.\d{3})*(?:,\d{2})?\-?'
+_MOVEMENT_AMOUNT_RE = re.compile(rf'({_MONTO_STR}(?:\s+(?:{_MONTO_STR}|_))?)\s*_?\s*$')
+_TITULAR_RE = re.compile(r'Total\s+Consumos\s+de\s+(.+?)\s+([\d.,]+)')
+_DOBLE_MONTO_RE = re.compile(r'([\d.,]+\-?)\s+([\d.,_]+\-?)\s*_?\s*$')
+_SIMPLE_MONTO_RE = re.compile(r'([.\d,\-]+)\s*$')
+_CUOTA_RE = re.compile(r'\s+(?:Cuota\s+)?(\d{2}/\d{2})\s*$')
+_COMPROBANTE_RE = re.compile(r'^(\w+\*?[KX]?)')
+_FECHA_RE = re.compile(r'^(\d{2}\.\d{2}\.\d{2})$')
+_MONTO_CLEAN_RE = re.compile(r'^\d{1,3}(?:\.\d{3})*(?:,\d{2})?$')
+_NONNUM_RE = re.compile(r'[^\d,.]')
+_HEADER_RE = re.compile(r'FECHA.*COMPROBANTE.*DETALLE')
+_LINE_RE = re.compile(r'.+')
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_ddmmyy(fecha_str: str) -> Optional[datetime]:
+    """
+    Convierte una fecha DD.MM.YY a datetime, memoizando por string único.
+    Los resúmenes repiten las mismas fechas en decenas de movimientos,
+    así que el cache reduce la conversión a una por fecha única.
+
+    El formato es fijo (ya validado por _FECHA_RE), por lo que se arma el
+    datetime con el constructor directamente: strptime paga parseo del
+    format string y lookups de locale en cada llamada solo para terminar
+    haciendo estos mismos tres int().
+    """
+    day, month, year = fecha_str.split('.')
+    try:
+        return datetime(2000 + int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+
+def _get_max_workers(task_count: int) -> int:
+    """Cantidad de workers para procesar PDFs en paralelo"""
+    return min(task_count, os.cpu_count() or 1)
+
+
+# Entradas máximas del cache de texto en memoria de cada TextBasedExtractor
+_MEM_TEXT_CACHE_MAX = 32
+
+
+def _text_cache_path(pdf_path: Path) -> Path:
+    """
+    Ruta del archivo de cache de texto para un PDF, con clave
+    (nombre, mtime, tamaño): cualquier cambio del PDF invalida la entrada
+    """
+    stat = pdf_path.stat()
+    key = f"{stat.st_mtime_ns}:{stat.st_size}:{pdf_path.name}"
+    return TEXT_CACHE_DIR / hashlib.md5(key.encode()).hexdigest()
+
+
+def _parse_fixed(line: str, fp: FixedPositions) -> List[Movement]:
+    """
+    Parsea una línea de movimiento usando posiciones fijas exactas por columna.
+    Extrae de derecha a izquierda: monto -> cuota -> descripción -> comprobante -> fecha
+
+    Las posiciones de inicio de columna (con keep_blank_chars=True) vienen
+    de la FixedPositions del banco; para Patagonia: fecha 7, comprobante 20,
+    descripción 31, monto alineado a la derecha desde la posición 80.
+    """
+    movements = []
+
+    # Verificar que la línea no esté vacía
+    if not line or len(line.strip()) < 10:
+        return movements
+
+    # 1. Detectar monto(s) al final - puede haber uno o dos montos separados
+    min_amount_pos = fp.min_amount_pos
+
+    # Buscar desde la posición mínima con pos en lugar de recortar la línea
+    monto_doble_match = _DOBLE_MONTO_RE.search(line, min_amount_pos)
+    monto_simple_match = _SIMPLE_MONTO_RE.search(line, min_amount_pos)
+
+    monto_raw = None
+    monto_start_pos = 0
+
+    if monto_doble_match:
+        # Línea con dos montos - usar el primer monto (principal)
+        monto_raw = monto_doble_match.group(1)
+        monto_start_pos = monto_doble_match.start()
+    elif monto_simple_match:
+        # Línea con un monto
+        monto_raw = monto_simple_match.group(1)
+        monto_start_pos = monto_simple_match.start()
+    else:
+        return movements
+
+    # Detectar signo negativo sin recortar el string: _NONNUM_RE ya elimina
+    # el '-' junto con cualquier otro caracter no numérico, y el signo se
+    # aplica al final sobre el float. En el caso común (monto positivo y
+    # limpio) no se asigna ningún string intermedio
+    is_negative = monto_raw.endswith('-')
+
+    # Limpiar y validar formato de número argentino
+    monto_clean = _NONNUM_RE.sub('', monto_raw)
+    if not _MONTO_CLEAN_RE.match(monto_clean):
+        return movements
+
+    # En lugar de recrear substrings con slice+rstrip por cada columna,
+    # avanzar un índice de fin hacia la izquierda sobre la línea original
+    # y usar pos/endpos de los patrones compilados
+    end = monto_start_pos
+    while end > 0 and line[end - 1].isspace():
+        end -= 1
+
+    # 2. Extraer cuota desde los últimos caracteres (búsqueda hacia atrás)
+    cuota = ""
+    cuota_match = _CUOTA_RE.search(line, 0, end)
+    if cuota_match:
+        cuota = cuota_match.group(1)
+        # Retroceder el fin hasta antes de la cuota encontrada
+        end = cuota_match.start()
+        while end > 0 and line[end - 1].isspace():
+            end -= 1
+
+    # 3. Extraer descripción desde su columna
+    descripcion = ""
+    if end > fp.descripcion_start:
+        descripcion = line[fp.descripcion_start:end].strip()
+        end = fp.descripcion_start
+        while end > 0 and line[end - 1].isspace():
+            end -= 1
+
+    # 4. Extraer comprobante desde su columna
+    comprobante = ""
+    if end > fp.comprobante_start:
+        comprobante_substring = line[fp.comprobante_start:end].strip()
+        if comprobante_substring:
+            # Buscar patrón de comprobante
+            comprobante_match = _COMPROBANTE_RE.match(comprobante_substring)
+            if comprobante_match:
+                comprobante = comprobante_match.group(1)
+        end = fp.comprobante_start
+        while end > 0 and line[end - 1].isspace():
+            end -= 1
+
+    # 5. Extraer fecha desde su columna
+    fecha_final = None
+    if end >= fp.fecha_end:
+        possible_fecha = line[fp.fecha_start:fp.fecha_end].strip()
+        fecha_match = _FECHA_RE.match(possible_fecha)
+        if fecha_match:
+            fecha_str = fecha_match.group(1)
+            try:
+                fecha_final = _parse_ddmmyy(fecha_str)
+            except Exception:
+                fecha_final = None
+
+    # Procesar descripción - usar la extraída o toda la línea si no hay descripción
+    descripcion_final = descripcion.strip() if descripcion else ""
+    if not descripcion_final:
+        descripcion_final = line[:monto_start_pos].strip()
+    
+    # Limpiar descripción usando la función de utils
+    descripcion_final = clean_description(descripcion_final)
+    
+    # Procesar monto usando la función de utils
+    importe_final = extract_amount(monto_clean)
+    if importe_final is not None and is_negative:
+        importe_final = -importe_final
+    
+    # Crear movimiento directamente, validando descripción e importe
+    if descripcion_final and importe_final is not None:
+        movements.append(Movement(
+            fecha=fecha_final,
+            comprobante=comprobante,
+            descripcion=descripcion_final,
+            importe=importe_final,
+            cuota=cuota,
+            moneda='ARS',
+        ))
+
+    return movements
+
 class BaseExtractor:
     """
     Clase base abstracta para extractores de resúmenes de tarjeta
@@ -29,7 +239,7 @@ class BaseExtractor:
         self.config = bank_config
         self.last_resumen_info = None
     
-    def extract_movements(self, pdf_path: Path) -> List[Dict]:
+    def extract_movements(self, pdf_path: Path) -> List[Movement]:
         """
         Extrae movimientos del PDF
         
@@ -37,28 +247,82 @@ class BaseExtractor:
             pdf_path: Ruta al archivo PDF
             
         Returns:
-            Lista de diccionarios con movimientos extraídos
+            Lista de objetos Movement con movimientos extraídos
         """
-        debug_log(f"🔵 [BaseExtractor.extract_movements] Iniciando extracción de: {pdf_path.name}")
+        if DEBUG_MODE:
+            debug_log(f"🔵 [BaseExtractor.extract_movements] Iniciando extracción de: {pdf_path.name}")
         
         movements = self._extract_movements_from_file(pdf_path)
         
-        debug_log(f"🔵 [BaseExtractor.extract_movements] Movimientos extraídos: {len(movements)}")
+        if DEBUG_MODE:
+            debug_log(f"🔵 [BaseExtractor.extract_movements] Movimientos extraídos: {len(movements)}")
         
         # Asignar metadatos a todos los movimientos
         banco = self.config.get('processor', '').title()
         
-        debug_log(f"🔵 [BaseExtractor.extract_movements] Asignando metadata - Banco: {banco}, Archivo: {pdf_path.name}")
+        if DEBUG_MODE:
+            debug_log(f"🔵 [BaseExtractor.extract_movements] Asignando metadata - Banco: {banco}, Archivo: {pdf_path.name}")
         
         for movement in movements:
-            movement['archivo_origen'] = pdf_path.name
-            movement['banco'] = banco
+            movement.archivo_origen = pdf_path.name
+            movement.banco = banco
         
-        debug_log(f"🔵 [BaseExtractor.extract_movements] Finalizado - Total movimientos: {len(movements)}")
+        if DEBUG_MODE:
+            debug_log(f"🔵 [BaseExtractor.extract_movements] Finalizado - Total movimientos: {len(movements)}")
         
         return movements
-    
-    def _extract_movements_from_file(self, pdf_path: Path) -> List[Dict]:
+
+    def extract_movements_columns(self, pdf_path: Path) -> Dict[str, list]:
+        """
+        Extrae movimientos como diccionario de columnas (SoA)
+
+        Para consumidores que agregan por columna (p.ej. DataFrames:
+        pd.DataFrame(dict_de_listas) es un orden de magnitud más rápido que
+        construirlo desde una lista de filas). El parseo produce objetos
+        Movement por fila; este método solo los pivotea a columnas en una
+        pasada.
+
+        Args:
+            pdf_path: Ruta al archivo PDF
+
+        Returns:
+            Diccionario columna -> lista de valores, todas del mismo largo
+        """
+        movements = self.extract_movements(pdf_path)
+
+        columns = {key: [] for key in _MOVEMENT_COLUMNS}
+        for movement in movements:
+            for key, values in columns.items():
+                values.append(getattr(movement, key))
+
+        return columns
+
+    def extract_movements_batch(self, pdf_paths: List[Path]) -> List[List[Movement]]:
+        """
+        Extrae movimientos de varios PDFs en paralelo
+
+        Cada PDF es independiente, así que el lote se reparte entre procesos
+        (el parsing de pdfplumber es CPU-bound y no libera bien el GIL).
+
+        Args:
+            pdf_paths: Rutas a los archivos PDF
+
+        Returns:
+            Lista de listas de movimientos, en el mismo orden que pdf_paths
+        """
+        if not pdf_paths:
+            return []
+
+        if len(pdf_paths) == 1:
+            return [self.extract_movements(pdf_paths[0])]
+
+        if DEBUG_MODE:
+            debug_log(f"🔵 [BaseExtractor.extract_movements_batch] Procesando {len(pdf_paths)} PDFs en paralelo")
+
+        with ProcessPoolExecutor(max_workers=_get_max_workers(len(pdf_paths))) as executor:
+            return list(executor.map(self.extract_movements, pdf_paths, chunksize=1))
+
+    def _extract_movements_from_file(self, pdf_path: Path) -> List[Movement]:
         """
         Extrae movimientos del archivo PDF
         Debe ser implementado por cada subclase
@@ -67,31 +331,41 @@ class BaseExtractor:
             pdf_path: Ruta al archivo PDF
             
         Returns:
-            Lista de diccionarios con movimientos extraídos
+            Lista de objetos Movement con movimientos extraídos
         """
         raise NotImplementedError("Subclases deben implementar _extract_movements_from_file()")
     
-    def _extract_pages_from_pdf(self, pdf_path: Path):
+    @contextmanager
+    def _open_pdf(self, pdf_path: Path):
         """
-        Extrae páginas del PDF
-        
+        Abre el PDF como context manager, garantizando el cierre
+
+        El objeto pdf de pdfplumber cachea chars/líneas/rects de cada página
+        renderizada mientras viva; mantenerlo abierto más allá de la
+        extracción acumula memoria O(cantidad de páginas).
+
         Args:
             pdf_path: Ruta al archivo PDF
-            
-        Returns:
-            Lista de páginas del PDF (pdfplumber pages)
+
+        Yields:
+            Objeto pdfplumber.PDF, o None si no se pudo abrir
         """
-        debug_log(f"🔵 [BaseExtractor._extract_pages_from_pdf] Abriendo PDF: {pdf_path.name}")
-        
+        if DEBUG_MODE:
+            debug_log(f"🔵 [BaseExtractor._open_pdf] Abriendo PDF: {pdf_path.name}")
+
         try:
             pdf = pdfplumber.open(pdf_path)
-            
-            debug_log(f"🔵 [BaseExtractor._extract_pages_from_pdf] PDF abierto exitosamente - Páginas: {len(pdf.pages)}")
-            
-            return pdf.pages
         except Exception as e:
-            logger.error(f"❌ [BaseExtractor._extract_pages_from_pdf] Error abriendo PDF {pdf_path}: {e}")
-            return []
+            logger.error(f"❌ [BaseExtractor._open_pdf] Error abriendo PDF {pdf_path}: {e}")
+            yield None
+            return
+
+        try:
+            if DEBUG_MODE:
+                debug_log(f"🔵 [BaseExtractor._open_pdf] PDF abierto exitosamente - Páginas: {len(pdf.pages)}")
+            yield pdf
+        finally:
+            pdf.close()
 
 
 class TextBasedExtractor(BaseExtractor):
@@ -112,8 +386,26 @@ class TextBasedExtractor(BaseExtractor):
     - Más frágil ante cambios de formato
     - Requiere más mantenimiento
     """
-    
-    def _extract_movements_from_file(self, pdf_path: Path) -> List[Dict]:
+
+    def __init__(self, bank_config: Dict):
+        """
+        Inicializa el extractor y compila los marcadores de fin de sección
+        en una sola alternancia (un escaneo por línea en vez de uno por marcador)
+        """
+        super().__init__(bank_config)
+        markers = self.config.get('movement_section_end', [])
+        self._end_markers_re = re.compile('|'.join(p.pattern for p in markers)) if markers else None
+        # Posiciones de columna resueltas una sola vez; los accesos del loop
+        # caliente son cargas de atributo sobre la dataclass con slots
+        self._fp = self.config.get('fixed_positions') or FixedPositions()
+        self._min_line_length = self._fp.min_line_length
+        self._max_line_length = self._fp.max_line_length
+        # Cache de texto en memoria por (ruta, mtime, tamaño). Como las
+        # instancias se comparten vía get_extractor, re-procesar el mismo
+        # PDF en una corrida se saltea pdfplumber y el disco por completo
+        self._mem_text_cache = {}
+
+    def _extract_movements_from_file(self, pdf_path: Path) -> List[Movement]:
         """
         Extrae movimientos del archivo PDF usando análisis de texto
         
@@ -121,22 +413,66 @@ class TextBasedExtractor(BaseExtractor):
             pdf_path: Ruta al archivo PDF
             
         Returns:
-            Lista de diccionarios con movimientos extraídos
+            Lista de objetos Movement con movimientos extraídos
         """
-        debug_log(f"🟢 [TextBasedExtractor.extract_movements_from_file] Iniciando extracción basada en texto")
-        
-        pages = self._extract_pages_from_pdf(pdf_path)
-        if not pages:
-            warning_log(f"⚠️  [TextBasedExtractor.extract_movements_from_file] No se pudieron extraer páginas")
-            return []
-        
-        full_text = self._extract_text_from_pages(pages)
-        
-        debug_log(f"🟢 [TextBasedExtractor.extract_movements_from_file] Texto extraído - Caracteres: {len(full_text)}")
+        if DEBUG_MODE:
+            debug_log(f"🟢 [TextBasedExtractor.extract_movements_from_file] Iniciando extracción basada en texto")
+
+        # Cache en memoria, con la misma clave de invalidación que el de
+        # disco: el hit no toca ni pdfplumber ni el filesystem
+        try:
+            stat = pdf_path.stat()
+            mem_key = (str(pdf_path), stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            mem_key = None
+
+        if mem_key is not None and mem_key in self._mem_text_cache:
+            if DEBUG_MODE:
+                debug_log(f"🟢 [TextBasedExtractor.extract_movements_from_file] Texto recuperado del cache en memoria")
+            return self._extract_movements_from_text(self._mem_text_cache[mem_key])
+
+        # Cache opcional en disco: si el PDF no cambió, saltear pdfplumber
+        full_text = None
+        cache_file = None
+        if TEXT_CACHE_ENABLED:
+            try:
+                cache_file = _text_cache_path(pdf_path)
+                if cache_file.exists():
+                    full_text = cache_file.read_text(encoding='utf-8')
+                    if DEBUG_MODE:
+                        debug_log(f"🟢 [TextBasedExtractor.extract_movements_from_file] Texto recuperado del cache: {cache_file.name}")
+            except OSError:
+                cache_file = None
+
+        if full_text is None:
+            with self._open_pdf(pdf_path) as pdf:
+                if pdf is None:
+                    warning_log(f"⚠️  [TextBasedExtractor.extract_movements_from_file] No se pudieron extraer páginas")
+                    return []
+
+                full_text = self._extract_text_from_pages(pdf.pages)
+
+            if cache_file is not None:
+                try:
+                    TEXT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                    cache_file.write_text(full_text, encoding='utf-8')
+                except OSError:
+                    pass
+
+        # Poblar el cache en memoria, desalojando la entrada más vieja si
+        # se alcanzó el límite
+        if mem_key is not None:
+            if len(self._mem_text_cache) >= _MEM_TEXT_CACHE_MAX:
+                self._mem_text_cache.pop(next(iter(self._mem_text_cache)))
+            self._mem_text_cache[mem_key] = full_text
+
+        if DEBUG_MODE:
+            debug_log(f"🟢 [TextBasedExtractor.extract_movements_from_file] Texto extraído - Caracteres: {len(full_text)}")
         
         movements = self._extract_movements_from_text(full_text)
         
-        debug_log(f"🟢 [TextBasedExtractor.extract_movements_from_file] Movimientos parseados del texto: {len(movements)}")
+        if DEBUG_MODE:
+            debug_log(f"🟢 [TextBasedExtractor.extract_movements_from_file] Movimientos parseados del texto: {len(movements)}")
         
         return movements
     
@@ -150,90 +486,111 @@ class TextBasedExtractor(BaseExtractor):
         Returns:
             Texto completo extraído de todas las páginas
         """
-        debug_log(f"🟢 [TextBasedExtractor._extract_text_from_pages] Extrayendo texto de {len(pages)} página(s)")
+        if DEBUG_MODE:
+            debug_log(f"🟢 [TextBasedExtractor._extract_text_from_pages] Extrayendo texto de {len(pages)} página(s)")
         
-        # Extraer texto completo de todas las páginas
-        full_text = ""
-        for i, page in enumerate(pages, 1):
+        # Extraer texto de las páginas. Para PDFs multipágina se reparte entre
+        # threads: gran parte del trabajo de pdfminer libera el GIL, así que
+        # las páginas se solapan. executor.map preserva el orden de páginas.
+        def extract_page_text(page):
             page_text = page.extract_text(keep_blank_chars=True)
-            if page_text:
-                full_text += page_text
-                debug_log(f"🟢 [TextBasedExtractor._extract_text_from_pages] Página {i}: {len(page_text)} caracteres")
-        
-        debug_log(f"🟢 [TextBasedExtractor._extract_text_from_pages] Texto total extraído: {len(full_text)} caracteres")
-        
+            # Liberar los chars/objetos cacheados de la página ya extraída
+            # para que la memoria quede acotada a las páginas en vuelo
+            page.flush_cache()
+            return page_text or ''
+
+        if len(pages) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(pages))) as executor:
+                texts = list(executor.map(extract_page_text, pages))
+        else:
+            texts = [extract_page_text(page) for page in pages]
+
+        if DEBUG_MODE:
+            for i, page_text in enumerate(texts, 1):
+                if page_text:
+                    debug_log(f"🟢 [TextBasedExtractor._extract_text_from_pages] Página {i}: {len(page_text)} caracteres")
+
+        full_text = ''.join(texts)
+
+        if DEBUG_MODE:
+            debug_log(f"🟢 [TextBasedExtractor._extract_text_from_pages] Texto total extraído: {len(full_text)} caracteres")
+
         return full_text
     
-    def _extract_movements_from_text(self, text: str) -> List[Dict]:
+    def _extract_movements_from_text(self, text: str) -> List[Movement]:
         """
         Extrae todos los movimientos del texto
+
+        Localiza cada sección de movimientos buscando header y marcador de fin
+        directamente sobre el texto completo, y recién ahí itera líneas dentro
+        de la sección. Evita materializar con split('\\n') las miles de líneas
+        fuera de sección que el loop anterior recorría solo para descartar.
         """
-        debug_log(f"🟢 [TextBasedExtractor._extract_movements_from_text] Parseando movimientos del texto")
-        
+        if DEBUG_MODE:
+            debug_log(f"🟢 [TextBasedExtractor._extract_movements_from_text] Parseando movimientos del texto")
+
         movements = []
-        lines = text.split('\n')
-        
-        debug_log(f"🟢 [TextBasedExtractor._extract_movements_from_text] Total líneas: {len(lines)}")
-        
-        # Buscar sección de movimientos
-        in_movement_section = False
         lines_processed = 0
         lines_parsed = 0
-        
-        for i, line in enumerate(lines):
-            if not line.strip():
-                continue
-            
-            # Verificar si estamos entrando en una sección de movimientos
-            if not in_movement_section:
-                if "FECHA" in line and "COMPROBANTE" in line and "DETALLE" in line:
-                    in_movement_section = True
-                    debug_log(f"🟢 [TextBasedExtractor._extract_movements_from_text] ✅ Encontrada sección de movimientos en línea {i}")
-                continue
-            
-            # Verificar si estamos saliendo de la sección de movimientos
-            if in_movement_section:
-                # Buscar texto que indica el final de los movimientos
-                if ("DEBITAREMOS DE SU" in line or
-                    "Plan V:" in line or 
-                    "CFTEA" in line or 
-                    "Condiciones vigentes" in line or
-                    "Estimado Cliente" in line):
-                    in_movement_section = False
-                    debug_log(f"🟢 [TextBasedExtractor._extract_movements_from_text] ⛔ Fin de sección de movimientos en línea {i}")
+
+        pos = 0
+        text_len = len(text)
+        while pos < text_len:
+            # Buscar el header de la próxima sección de movimientos
+            header_match = _HEADER_RE.search(text, pos)
+            if not header_match:
+                break
+
+            # La sección empieza en la línea siguiente al header
+            section_start = text.find('\n', header_match.end())
+            if section_start < 0:
+                break
+            section_start += 1
+
+            if DEBUG_MODE:
+                debug_log(f"🟢 [TextBasedExtractor._extract_movements_from_text] ✅ Encontrada sección de movimientos en offset {header_match.start()}")
+
+            # Buscar el marcador de fin; la sección termina al inicio de esa línea
+            end_match = self._end_markers_re.search(text, section_start) if self._end_markers_re else None
+            if end_match:
+                section_end = text.rfind('\n', section_start, end_match.start()) + 1
+                if section_end < section_start:
+                    section_end = section_start
+                if DEBUG_MODE:
+                    debug_log(f"🟢 [TextBasedExtractor._extract_movements_from_text] ⛔ Fin de sección de movimientos en offset {end_match.start()}")
+            else:
+                section_end = text_len
+
+            for line_match in _LINE_RE.finditer(text, section_start, section_end):
+                line = line_match.group(0)
+                if not line.strip():
                     continue
-            
-            # Solo procesar si estamos en sección de movimientos
-            if in_movement_section:
+
                 lines_processed += 1
-                
+
                 # Verificar si es una línea de resumen por titular
                 titular_nombre = self._extract_titular_info(line)
                 if titular_nombre:
                     # Crear pseudo-movimiento simplificado
-                    pseudo_movement = {
-                        'fecha': None,
-                        'comprobante': "",
-                        'descripcion': "",
-                        'importe': 0,
-                        'cuota': "",
-                        'moneda': "",
-                        'titular': titular_nombre
-                    }
-                    movements.append(pseudo_movement)
-                    debug_log(f"🟢 [TextBasedExtractor._extract_movements_from_text] 👤 Titular encontrado: {titular_nombre}")
+                    movements.append(Movement(titular=titular_nombre))
+                    if DEBUG_MODE:
+                        debug_log(f"🟢 [TextBasedExtractor._extract_movements_from_text] 👤 Titular encontrado: {titular_nombre}")
                     continue
-                
+
                 if self._looks_like_movement(line):
                     # Procesar directamente con posiciones fijas
                     parsed_movements = self._parse_by_fixed_positions(line)
-                    
+
                     if parsed_movements:
                         movements.extend(parsed_movements)
                         lines_parsed += 1
-        
-        debug_log(f"🟢 [TextBasedExtractor._extract_movements_from_text] Líneas procesadas: {lines_processed}, Líneas parseadas: {lines_parsed}, Movimientos totales: {len(movements)}")
-        
+
+            # Continuar después del marcador de fin por si hay otra sección
+            pos = end_match.end() if end_match else text_len
+
+        if DEBUG_MODE:
+            debug_log(f"🟢 [TextBasedExtractor._extract_movements_from_text] Líneas procesadas: {lines_processed}, Líneas parseadas: {lines_parsed}, Movimientos totales: {len(movements)}")
+
         return movements
     
     def _extract_titular_info(self, line: str) -> str:
@@ -241,157 +598,45 @@ class TextBasedExtractor(BaseExtractor):
         Extrae solo el nombre del titular de las líneas de resumen.
         Formato esperado: "Tarjeta XXXX Total Consumos de NOMBRE APELLIDO     MONTO"
         """
-        # Patrón para detectar líneas de resumen por titular
-        if "Total Consumos de" in line and "Tarjeta" in line:
-            # Extraer nombre (después de "Total Consumos de")
-            nombre_match = re.search(r'Total\s+Consumos\s+de\s+(.+?)\s+([\d.,]+)', line)
-            if nombre_match:
-                return nombre_match.group(1).strip()
-        
+        # Cortar temprano con un único str.find: la enorme mayoría de las
+        # líneas no contiene "Total Consumos de", así que el segundo chequeo
+        # y el regex casi nunca llegan a ejecutarse
+        idx = line.find("Total Consumos de")
+        if idx < 0 or "Tarjeta" not in line:
+            return None
+
+        # Extraer nombre (después de "Total Consumos de")
+        nombre_match = _TITULAR_RE.search(line, idx)
+        if nombre_match:
+            return nombre_match.group(1).strip()
+
         return None
     
     def _looks_like_movement(self, line: str) -> bool:
         """
         Determina si una línea parece contener un movimiento usando dos criterios:
-        1. Longitud entre 103-124 caracteres
+        1. Longitud dentro de la ventana min/max de la configuración
         2. Contiene un monto al final (considerando líneas con dos montos)
         """
-        # Criterio 1: Longitud de línea
+        # Criterio 1: Longitud de línea (filtro barato antes del regex)
         line_len = len(line)
-        if line_len < 103 or line_len > 124:
+        if line_len < self._min_line_length or line_len > self._max_line_length:
             return False
         
         # Criterio 2: Monto al final (puede haber dos montos separados por espacios o guiones bajos)
-        # Patrón para un monto: [\d]{1,3}(?:\.[\d]{3})*(?:,[\d]{2})?\-?
         # Permitir uno o dos montos al final de la línea, considerando guiones bajos como placeholder
-        monto_pattern = r'[\d]{1,3}(?:\.[\d]{3})*(?:,[\d]{2})?\-?'
-        has_amount = bool(re.search(rf'({monto_pattern}(?:\s+(?:{monto_pattern}|_))?)\s*_?\s*$', line))
-        
+        has_amount = bool(_MOVEMENT_AMOUNT_RE.search(line))
+
         return has_amount
     
-    def _parse_by_fixed_positions(self, line: str) -> List[Dict]:
+    def _parse_by_fixed_positions(self, line: str) -> List[Movement]:
         """
         Parsea una línea usando posiciones fijas exactas para cada columna.
-        Extrae de derecha a izquierda: monto -> cuota -> descripción -> comprobante -> fecha
-        
-        Posiciones de inicio de columnas (con keep_blank_chars=True):
-        - fecha: 7 (después de espacios iniciales)
-        - comprobante: 21 (después de fecha + espacios)  
-        - descripción: 31 (después del comprobante + espacios)
-        - monto: alineado a la derecha (variable)
+        Delega en la función de módulo _parse_fixed (el hot loop no necesita
+        estado de la instancia, lo que además permitiría reemplazarla por una
+        implementación compilada sin tocar esta interfaz).
         """
-        movements = []
-        original_line = line
-        
-        # Verificar que la línea no esté vacía
-        if not line or len(line.strip()) < 10:
-            return movements
-        
-        # 1. Detectar monto(s) al final - puede haber uno o dos montos separados
-        # Fijar posición mínima desde columna de cuotas (pos ~65) + extensión (~15) = pos 80
-        min_amount_pos = 80
-        
-        # Patrón más específico para capturar líneas con dos montos desde posición mínima
-        monto_doble_match = re.search(rf'([\d.,]+\-?)\s+([\d.,_]+\-?)\s*_?\s*$', line[min_amount_pos:])
-        monto_simple_match = re.search(rf'([.\d,\-]+)\s*$', line[min_amount_pos:])
-        
-        monto_raw = None
-        monto_start_pos = 0
-        
-        if monto_doble_match:
-            # Línea con dos montos - usar el primer monto (principal)
-            monto_raw = monto_doble_match.group(1)
-            monto_start_pos = min_amount_pos + monto_doble_match.start()
-        elif monto_simple_match:
-            # Línea con un monto
-            monto_raw = monto_simple_match.group(1)
-            monto_start_pos = min_amount_pos + monto_simple_match.start()
-        else:
-            return movements
-        
-        # Detectar signo negativo
-        is_negative = monto_raw.endswith('-')
-        if is_negative:
-            monto_raw = monto_raw[:-1]
-        
-        # Limpiar y validar formato de número argentino
-        monto_clean = re.sub(r'[^\d,.]', '', monto_raw)
-        if not re.match(r'^\d{1,3}(?:\.\d{3})*(?:,\d{2})?$', monto_clean):
-            return movements
-        
-        monto_str = monto_clean + ('-' if is_negative else '')
-        
-        # Limpiar la línea eliminando el monto (modificar la misma variable line)
-        line = line[:monto_start_pos].rstrip()
-        
-        # 2. Extraer cuota desde los últimos caracteres (búsqueda hacia atrás)
-        cuota = ""
-        cuota_match = re.search(r'\s+(?:Cuota\s+)?(\d{2}/\d{2})\s*$', line)
-        if cuota_match:
-            cuota = cuota_match.group(1)
-            # Limpiar la línea eliminando la cuota encontrada
-            line = line[:cuota_match.start()].rstrip()
-        
-        # 3. Extraer descripción desde posición 31
-        descripcion = ""
-        if len(line) > 31:
-            descripcion = line[31:].strip()
-            # Limpiar la línea eliminando la descripción
-            line = line[:31].rstrip()
-        
-        # 4. Extraer comprobante desde posición 21  
-        comprobante = ""
-        if len(line) > 20:
-            comprobante_substring = line[20:].strip()
-            if comprobante_substring:
-                # Buscar patrón de comprobante
-                comprobante_match = re.match(r'^(\w+\*?[KX]?)', comprobante_substring)
-                if comprobante_match:
-                    comprobante = comprobante_match.group(1)
-            # Limpiar la línea eliminando el comprobante
-            line = line[:20].rstrip()
-        
-        # 5. Extraer fecha desde posición 7
-        fecha_final = None
-        if len(line) >= 15:  # 7 + 8 caracteres de fecha
-            possible_fecha = line[7:15].strip()
-            fecha_match = re.match(r'^(\d{2}\.\d{2}\.\d{2})$', possible_fecha)
-            if fecha_match:
-                fecha_str = fecha_match.group(1)
-                try:
-                    day, month, year = fecha_str.split('.')
-                    year = f"20{year}" if len(year) == 2 else year
-                    fecha_completa = f"{day}/{month}/{year}"
-                    fecha_final = parse_date(fecha_completa, ["%d/%m/%Y"])
-                except:
-                    fecha_final = None
-        
-        # Procesar descripción - usar la extraída o toda la línea si no hay descripción
-        descripcion_final = descripcion.strip() if descripcion else ""
-        if not descripcion_final:
-            descripcion_final = original_line[:monto_start_pos].strip()
-        
-        # Limpiar descripción usando la función de utils
-        descripcion_final = clean_description(descripcion_final)
-        
-        # Procesar monto usando la función de utils
-        importe_final = extract_amount(monto_str)
-        
-        # Crear movimiento directamente
-        movement = {
-            'fecha': fecha_final,
-            'comprobante': comprobante if comprobante else "",
-            'descripcion': descripcion_final,
-            'importe': importe_final,
-            'cuota': cuota if cuota else "",
-            'moneda': 'ARS'
-        }
-        
-        # Validar que tenga descripción e importe válidos
-        if movement['descripcion'] and movement['importe'] is not None:
-            movements.append(movement)
-        
-        return movements
+        return _parse_fixed(line, self._fp)
 
 
 class TableBasedExtractor(BaseExtractor):
@@ -413,7 +658,7 @@ class TableBasedExtractor(BaseExtractor):
     - Necesita identificar header de tabla
     """
     
-    def _extract_movements_from_file(self, pdf_path: Path) -> List[Dict]:
+    def _extract_movements_from_file(self, pdf_path: Path) -> List[Movement]:
         """
         Extrae movimientos del archivo PDF usando extracción de tablas
         
@@ -421,22 +666,24 @@ class TableBasedExtractor(BaseExtractor):
             pdf_path: Ruta al archivo PDF
             
         Returns:
-            Lista de diccionarios con movimientos extraídos
+            Lista de objetos Movement con movimientos extraídos
         """
-        debug_log(f"🟡 [TableBasedExtractor.extract_movements_from_file] Iniciando extracción basada en tablas")
-        
-        pages = self._extract_pages_from_pdf(pdf_path)
-        if not pages:
-            warning_log(f"⚠️  [TableBasedExtractor.extract_movements_from_file] No se pudieron extraer páginas")
-            return []
-        
-        movements = self._extract_movements_from_tables(pages)
+        if DEBUG_MODE:
+            debug_log(f"🟡 [TableBasedExtractor.extract_movements_from_file] Iniciando extracción basada en tablas")
+
+        with self._open_pdf(pdf_path) as pdf:
+            if pdf is None:
+                warning_log(f"⚠️  [TableBasedExtractor.extract_movements_from_file] No se pudieron extraer páginas")
+                return []
+
+            movements = self._extract_movements_from_tables(pdf.pages)
         
-        debug_log(f"🟡 [TableBasedExtractor.extract_movements_from_file] Movimientos extraídos de tablas: {len(movements)}")
+        if DEBUG_MODE:
+            debug_log(f"🟡 [TableBasedExtractor.extract_movements_from_file] Movimientos extraídos de tablas: {len(movements)}")
         
         return movements
     
-    def _extract_movements_from_tables(self, pages) -> List[Dict]:
+    def _extract_movements_from_tables(self, pages) -> List[Movement]:
         """
         Extrae movimientos de tablas del PDF
         Debe ser implementado por cada banco específico
@@ -3,14 +3,43 @@ Extractor específico para PDFs de Banco Patagonia
 Usa estrategia TextBasedExtractor con posiciones fijas
 """
 import re
-from typing import List, Dict, Optional
+from math import fsum
+from typing import List
 from pathlib import Path
 import logging
-from extractors.base import TextBasedExtractor
+from extractors.base import TextBasedExtractor, Movement
 from utils import parse_date, clean_description, debug_log, warning_log
+from config import DEBUG_MODE, BANK_CONFIGS
 
 logger = logging.getLogger(__name__)
 
+def _partition_patterns(patterns):
+    """
+    Separa una lista de patrones compilados en literales y regex
+
+    Los patrones que son substrings literales se matchean con `in` (búsqueda
+    en C, mucho más barata que el motor de regex); el resto se une en un
+    solo patrón alternado. Devuelve (tupla de literales, regex unida o None).
+    """
+    literals = []
+    regexes = []
+    for p in patterns:
+        if re.escape(p.pattern) == p.pattern:
+            literals.append(p.pattern)
+        else:
+            regexes.append(p.pattern)
+    union = re.compile('|'.join(f'(?:{p})' for p in regexes)) if regexes else None
+    return tuple(literals), union
+
+# Configuración y patrones de saldo/cargos resueltos una sola vez al
+# importar el módulo: todas las instancias comparten el mismo bundle
+# compilado en lugar de rearmarlo en cada __init__. La unión en un solo
+# patrón hace que cada descripción se escanee una vez en lugar de una vez
+# por patrón de la lista.
+_CFG = BANK_CONFIGS["Patagonia"]
+_SALDO_LITERALS, _SALDO_RE = _partition_patterns(_CFG['saldo_patterns'])
+_CARGOS_LITERALS, _CARGOS_RE = _partition_patterns(_CFG['cargos_patterns'])
+
 class PatagoniaExtractor(TextBasedExtractor):
     """
     Extractor para resúmenes de tarjeta de crédito del Banco Patagonia
@@ -23,10 +52,14 @@ class PatagoniaExtractor(TextBasedExtractor):
     
     def __init__(self):
         """Inicializa el extractor con configuración de Patagonia"""
-        from config import BANK_CONFIGS
-        super().__init__(BANK_CONFIGS["Patagonia"])
+        super().__init__(_CFG)
+        # Solo referencias: los patrones se compilan a nivel de módulo
+        self._saldo_literals = _SALDO_LITERALS
+        self._saldo_re = _SALDO_RE
+        self._cargos_literals = _CARGOS_LITERALS
+        self._cargos_re = _CARGOS_RE
     
-    def extract(self, pdf_path: Path) -> List[Dict]:
+    def extract(self, pdf_path: Path) -> List[Movement]:
         """
         Extrae y procesa movimientos del PDF de Patagonia
         
@@ -34,14 +67,16 @@ class PatagoniaExtractor(TextBasedExtractor):
             pdf_path: Ruta al archivo PDF
             
         Returns:
-            Lista de diccionarios con movimientos extraídos y procesados
+            Lista de objetos Movement con movimientos extraídos y procesados
         """
-        debug_log(f"🟣 [PatagoniaExtractor.extract] Iniciando procesamiento de: {pdf_path.name}")
+        if DEBUG_MODE:
+            debug_log(f"🟣 [PatagoniaExtractor.extract] Iniciando procesamiento de: {pdf_path.name}")
         
         # Extraer movimientos usando el método heredado
         movements = self.extract_movements(pdf_path)
         
-        debug_log(f"🟣 [PatagoniaExtractor.extract] Movimientos base extraídos: {len(movements)}")
+        if DEBUG_MODE:
+            debug_log(f"🟣 [PatagoniaExtractor.extract] Movimientos base extraídos: {len(movements)}")
         
         if not movements:
             warning_log(f"⚠️  [PatagoniaExtractor.extract] No se encontraron movimientos")
@@ -54,58 +89,84 @@ class PatagoniaExtractor(TextBasedExtractor):
         pago_minimo = None
         
         # Extraer saldo anterior y eliminar movimientos relacionados
-        debug_log(f"🟣 [PatagoniaExtractor.extract] Extrayendo saldo anterior...")
+        if DEBUG_MODE:
+            debug_log(f"🟣 [PatagoniaExtractor.extract] Extrayendo saldo anterior...")
         
-        saldo_anterior, movements = self._extract_saldo_anterior(movements)
+        # Mayúsculas de cada descripción calculadas una sola vez: los dos
+        # filtros consecutivos comparten la lista paralela en lugar de
+        # llamar .upper() dos veces por movimiento
+        uppers = [mov.descripcion.upper() for mov in movements]
+
+        saldo_anterior, movements, uppers = self._extract_saldo_anterior(movements, uppers)
         resumen_info['saldo_anterior'] = saldo_anterior
         
-        debug_log(f"🟣 [PatagoniaExtractor.extract] Saldo anterior: ${saldo_anterior:,.2f}, Movimientos restantes: {len(movements)}")
+        if DEBUG_MODE:
+            debug_log(f"🟣 [PatagoniaExtractor.extract] Saldo anterior: ${saldo_anterior:,.2f}, Movimientos restantes: {len(movements)}")
         
         # Extraer cargos bancarios y eliminar movimientos relacionados
-        debug_log(f"🟣 [PatagoniaExtractor.extract] Extrayendo cargos bancarios...")
+        if DEBUG_MODE:
+            debug_log(f"🟣 [PatagoniaExtractor.extract] Extrayendo cargos bancarios...")
         
-        total_cargos, movements = self._extract_cargos_bancarios(movements)
+        total_cargos, movements, uppers = self._extract_cargos_bancarios(movements, uppers)
         resumen_info['cargos_bancarios'] = total_cargos
         
-        debug_log(f"🟣 [PatagoniaExtractor.extract] Cargos bancarios: ${total_cargos:,.2f}, Movimientos restantes: {len(movements)}")
+        if DEBUG_MODE:
+            debug_log(f"🟣 [PatagoniaExtractor.extract] Cargos bancarios: ${total_cargos:,.2f}, Movimientos restantes: {len(movements)}")
         
         # Extraer información de saldos de los movimientos antes de eliminar contrapartes
-        debug_log(f"🟣 [PatagoniaExtractor.extract] Extrayendo saldos y pago mínimo...")
-        
-        saldo_movements = []
-        for i, mov in enumerate(movements):
-            if 'SALDO ACTUAL' in mov['descripcion']:
-                saldo_actual = mov['importe']
-                saldo_movements.append(i)
-                debug_log(f"🟣 [PatagoniaExtractor.extract] Saldo actual encontrado: ${saldo_actual:,.2f}")
-            elif 'PAGO MINIMO' in mov['descripcion']:
-                pago_minimo = mov['importe']
-                saldo_movements.append(i)
-                debug_log(f"🟣 [PatagoniaExtractor.extract] Pago mínimo encontrado: ${pago_minimo:,.2f}")
-        
-        # Eliminar movimientos de saldo y pago mínimo
-        for i in reversed(saldo_movements):
-            del movements[i]
+        if DEBUG_MODE:
+            debug_log(f"🟣 [PatagoniaExtractor.extract] Extrayendo saldos y pago mínimo...")
+        
+        # Detectar saldo actual y pago mínimo y filtrar esos movimientos en
+        # una sola pasada (sin lista de índices ni borrados in-place).
+        # Cada marcador aparece a lo sumo una vez: encontrados los dos, el
+        # resto de los movimientos pasa sin chequeos de substring.
+        kept = []
+        for idx, mov in enumerate(movements):
+            if saldo_actual is not None and pago_minimo is not None:
+                kept.extend(movements[idx:])
+                break
+            descripcion = mov.descripcion
+            if saldo_actual is None and 'SALDO ACTUAL' in descripcion:
+                saldo_actual = mov.importe
+                if DEBUG_MODE:
+                    debug_log(f"🟣 [PatagoniaExtractor.extract] Saldo actual encontrado: ${saldo_actual:,.2f}")
+            elif pago_minimo is None and 'PAGO MINIMO' in descripcion:
+                pago_minimo = mov.importe
+                if DEBUG_MODE:
+                    debug_log(f"🟣 [PatagoniaExtractor.extract] Pago mínimo encontrado: ${pago_minimo:,.2f}")
+            else:
+                kept.append(mov)
+        movements = kept
         
-        debug_log(f"🟣 [PatagoniaExtractor.extract] Movimientos tras eliminar saldos: {len(movements)}")
+        if DEBUG_MODE:
+            debug_log(f"🟣 [PatagoniaExtractor.extract] Movimientos tras eliminar saldos: {len(movements)}")
         
         # Asignar titulares usando la nueva lógica
-        debug_log(f"🟣 [PatagoniaExtractor.extract] Asignando titulares...")
+        if DEBUG_MODE:
+            debug_log(f"🟣 [PatagoniaExtractor.extract] Asignando titulares...")
         
         movements = self._assign_titular_to_movements_advanced(movements)
         
-        debug_log(f"🟣 [PatagoniaExtractor.extract] Titulares asignados - Movimientos finales: {len(movements)}")
+        if DEBUG_MODE:
+            debug_log(f"🟣 [PatagoniaExtractor.extract] Titulares asignados - Movimientos finales: {len(movements)}")
         
         # Agregar información del resumen a los movimientos
         resumen_info['saldo_actual'] = saldo_actual
         resumen_info['pago_minimo'] = pago_minimo
         
         # Calcular totales por categoría para validación
-        debug_log(f"🟣 [PatagoniaExtractor.extract] Calculando totales para validación...")
-        
-        total_consumos = sum(mov['importe'] for mov in movements if mov['importe'] > 0)
-        bonificaciones = sum(mov['importe'] for mov in movements if mov['importe'] < 0)
-        saldo_calculado = saldo_anterior + total_consumos + bonificaciones + total_cargos
+        if DEBUG_MODE:
+            debug_log(f"🟣 [PatagoniaExtractor.extract] Calculando totales para validación...")
+        
+        # math.fsum es C-implementado y de redondeo exacto: elimina la
+        # deriva de float acumulada sobre cientos de importes, que con el
+        # umbral de validación de $1 podía producir fallas espurias
+        importes = [mov.importe for mov in movements]
+        total_consumos = fsum(x for x in importes if x > 0)
+        bonificaciones = fsum(x for x in importes if x < 0)
+        saldo_calculado = fsum((saldo_anterior, total_consumos,
+                                bonificaciones, total_cargos))
         
         resumen_info['total_consumos'] = total_consumos
         resumen_info['bonificaciones'] = bonificaciones
@@ -136,94 +197,84 @@ class PatagoniaExtractor(TextBasedExtractor):
         
         return movements
     
-    def _extract_saldo_anterior(self, movements: List[Dict]) -> tuple[float, List[Dict]]:
+    def _extract_saldo_anterior(self, movements: List[Movement],
+                                uppers: List[str]) -> tuple[float, List[Movement], List[str]]:
         """
-        Extrae el saldo anterior del resumen y elimina los movimientos relacionados
+        Extrae el saldo anterior del resumen y filtra los movimientos relacionados
+
+        Una sola pasada que acumula el total y arma la lista filtrada; el
+        esquema anterior de del movements[i] en reversa desplazaba la cola
+        de la lista en cada borrado (O(n) por elemento eliminado).
+        Recibe y devuelve la lista paralela de descripciones en mayúsculas
+        para que .upper() se calcule una sola vez entre este filtro y
+        _extract_cargos_bancarios.
         """
         saldo_anterior = 0.0
-        indices_a_eliminar = []
-        
-        for i, mov in enumerate(movements):
-            descripcion = mov.get('descripcion', '').upper()
-            
-            # Verificar si coincide con patrones de saldo
-            for pattern in self.config['saldo_patterns']:
-                if re.search(pattern, descripcion):
-                    saldo_anterior += mov.get('importe', 0)
-                    indices_a_eliminar.append(i)
-                    break
-        
-        # Eliminar movimientos encontrados (en orden inverso para mantener índices)
-        for i in reversed(indices_a_eliminar):
-            del movements[i]
-        
-        return saldo_anterior, movements
-    
-    def _extract_cargos_bancarios(self, movements: List[Dict]) -> tuple[float, List[Dict]]:
+        kept = []
+        kept_uppers = []
+
+        for mov, descripcion in zip(movements, uppers):
+            # Verificar si coincide con los patrones de saldo:
+            # primero los literales con `in`, después la regex unida
+            if any(lit in descripcion for lit in self._saldo_literals) or \
+               (self._saldo_re is not None and self._saldo_re.search(descripcion)):
+                saldo_anterior += mov.importe
+            else:
+                kept.append(mov)
+                kept_uppers.append(descripcion)
+
+        return saldo_anterior, kept, kept_uppers
+
+    def _extract_cargos_bancarios(self, movements: List[Movement],
+                                  uppers: List[str]) -> tuple[float, List[Movement], List[str]]:
         """
-        Extrae los cargos bancarios del resumen y elimina los movimientos relacionados
+        Extrae los cargos bancarios del resumen y filtra los movimientos relacionados
+
+        Mismo esquema de filtrado en una pasada que _extract_saldo_anterior.
         """
         total_cargos = 0.0
-        indices_a_eliminar = []
-        
-        for i, mov in enumerate(movements):
-            descripcion = mov.get('descripcion', '').upper()
-            
-            # Verificar si coincide con patrones de cargos bancarios
-            for pattern in self.config['cargos_patterns']:
-                if re.search(pattern, descripcion):
-                    total_cargos += mov.get('importe', 0)
-                    indices_a_eliminar.append(i)
-                    break
-        
-        # Eliminar movimientos encontrados (en orden inverso para mantener índices)
-        for i in reversed(indices_a_eliminar):
-            del movements[i]
-        
-        return total_cargos, movements
+        kept = []
+        kept_uppers = []
+
+        for mov, descripcion in zip(movements, uppers):
+            # Verificar si coincide con los patrones de cargos bancarios:
+            # primero los literales con `in`, después la regex unida
+            if any(lit in descripcion for lit in self._cargos_literals) or \
+               (self._cargos_re is not None and self._cargos_re.search(descripcion)):
+                total_cargos += mov.importe
+            else:
+                kept.append(mov)
+                kept_uppers.append(descripcion)
+
+        return total_cargos, kept, kept_uppers
     
-    def _assign_titular_to_movements_advanced(self, movements: List[Dict]) -> List[Dict]:
+    def _assign_titular_to_movements_advanced(self, movements: List[Movement]) -> List[Movement]:
         """
-        Asigna información de titular a los movimientos usando la nueva lógica simplificada
+        Asigna información de titular a los movimientos en una sola pasada
+
+        Los movimientos reales se acumulan hasta el pseudo-movimiento de
+        resumen que cierra el rango (la línea "Total Consumos de ..." viene
+        DESPUÉS de los consumos de ese titular), y ahí se les estampa el
+        nombre. Se construye una lista nueva sin los pseudo-movimientos,
+        evitando las tres pasadas y los del in-place (O(n) por borrado)
+        de la versión anterior.
         """
-        titulares_data = []  # Array de titulares con rangos
-        primer_movimiento = 0
-        movements_to_remove = []  # Índices de pseudo-movimientos a eliminar
-        ultimo_movimiento = 0
-        
-        # Primera pasada: identificar rangos de movimientos por titular
-        for i, mov in enumerate(movements):
-            # Combinar condiciones: si es pseudo-movimiento Y hay movimientos pendientes
-            if mov.get('titular') and primer_movimiento < i:
-                ultimo_movimiento = i - 1
-                titulares_data.append({
-                    'nombre': mov['titular'],
-                    'primer_movimiento': primer_movimiento,
-                    'ultimo_movimiento': ultimo_movimiento
-                })
-                primer_movimiento = i + 1
-                
-            # Marcar pseudo-movimiento para eliminar
-            if mov.get('titular'):
-                movements_to_remove.append(i)
-                if primer_movimiento == i:  # Si es el primer pseudo-movimiento
-                    primer_movimiento = i + 1
-        
-        # Segunda pasada: asignar titulares a movimientos (antes de eliminar pseudo-movimientos)
+        result = []
+        pending = []  # Movimientos reales desde el último cierre de rango
+
         for mov in movements:
-            mov['titular'] = ""  # Inicializar todos vacíos
-        
-        for titular_data in titulares_data:
-            nombre = titular_data['nombre']
-            inicio = titular_data['primer_movimiento']
-            fin = titular_data['ultimo_movimiento']
-            
-            for i in range(max(0, inicio), min(len(movements), fin + 1)):
-                movements[i]['titular'] = nombre
-        
-        # Tercera pasada: eliminar pseudo-movimientos (conservando índices ya asignados)
-        for i in reversed(movements_to_remove):
-            del movements[i]
-        
-        return movements
+            titular = mov.titular
+            if titular:
+                # Pseudo-movimiento: cierra el rango de los acumulados
+                for pending_mov in pending:
+                    pending_mov.titular = titular
+                result.extend(pending)
+                pending.clear()
+            else:
+                pending.append(mov)
+
+        # Movimientos sin pseudo-movimiento de cierre quedan sin titular
+        result.extend(pending)
+
+        return result
 
@@ -5,7 +5,11 @@ Uso:
   python tests/patagonia.py archivo.pdf        # Procesa solo ese archivo
 """
 import sys
+import os
 import argparse
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 # Agregar el directorio padre al path para importar módulos
@@ -19,56 +23,90 @@ logging.basicConfig(level=logging.INFO, format='%(message)s')
 logging.getLogger('pdfplumber').setLevel(logging.WARNING)
 logging.getLogger('pdfminer').setLevel(logging.WARNING)
 
+@dataclass(slots=True)
+class ValResult:
+    """
+    Resultado de validación de un PDF para el resumen final
+
+    Dataclass con slots en lugar del dict por fila: menos memoria y
+    acceso por atributo en el loop de impresión.
+    """
+    archivo: str
+    saldo_calculado: float
+    saldo_oficial: float
+    validacion_ok: bool
+    diferencia: float
+
 def save_movements_to_file(movements, pdf_file, output_folder, resumen_info=None):
     """Guarda los movimientos en un archivo de texto"""
-    month_identifier = pdf_file.stem.split('.')[-1] if '.' in pdf_file.stem else '2025-01'
+    stem = pdf_file.stem
+    month_identifier = stem.split('.')[-1] if '.' in stem else '2025-01'
     result_filename = output_folder / f"movimientos_{month_identifier}.txt"
     
-    with open(result_filename, 'w', encoding='utf-8') as f:
-        f.write(f"📊 MOVIMIENTOS: {pdf_file.name}\n")
-        f.write(f"{'='*80}\n\n")
-        
-        # Tabla de movimientos
-        f.write(f"{'#':<3} {'Fecha':<10} {'Comprobante':<12} {'Descripción':<30} {'Cuota':<8} {'Titular':<15} {'Monto':>12}\n")
-        f.write("-" * 100 + "\n")
-        
-        for i, mov in enumerate(movements, 1):
-            fecha_str = mov['fecha'].strftime('%Y-%m-%d') if mov.get('fecha') else ''
-            comprobante = (mov.get('comprobante', '') or '')[:11]
-            descripcion = (mov.get('descripcion', '') or '')[:29]
-            cuota = (mov.get('cuota', '') or '')[:7]
-            titular = (mov.get('titular', '') or '')[:14]
-            
-            f.write(f"{i:<3} {fecha_str:<10} {comprobante:<12} {descripcion:<30} "
-                   f"{cuota:<8} {titular:<15} ${mov['importe']:>11,.2f}\n")
-        
-        f.write("-" * 100 + "\n")
-        f.write(f"Total movimientos: {len(movements)}\n\n")
-        
-        # Validación si está disponible
-        if resumen_info:
-            f.write("\n📊 VALIDACIÓN:\n")
-            f.write(f"{'Categoría':<25} {'Importe':>15}\n")
-            f.write("-" * 42 + "\n")
-            f.write(f"{'Saldo anterior':<25} ${resumen_info.get('saldo_anterior', 0):>12,.2f}\n")
-            f.write(f"{'Total consumos':<25} ${resumen_info.get('total_consumos', 0):>12,.2f}\n")
-            f.write(f"{'Bonificaciones':<25} ${resumen_info.get('bonificaciones', 0):>12,.2f}\n")
-            f.write(f"{'Cargos bancarios':<25} ${resumen_info.get('cargos_bancarios', 0):>12,.2f}\n")
-            f.write("-" * 42 + "\n")
-            f.write(f"{'SALDO CALCULADO':<25} ${resumen_info.get('saldo_calculado', 0):>12,.2f}\n")
-            f.write(f"{'Saldo oficial':<25} ${resumen_info.get('saldo_actual', 0):>12,.2f}\n")
-            
-            if resumen_info.get('validacion_ok'):
-                f.write(f"{'Estado':<25} ✅ Validación exitosa\n")
-            else:
-                diferencia = resumen_info.get('diferencia_validacion', 0)
-                f.write(f"{'Diferencia':<25} ${diferencia:>12,.2f}\n")
-                f.write(f"{'Estado':<25} ⚠️ Diferencia significativa\n")
+    # Armar todas las líneas en memoria y emitir un único write: decenas de
+    # llamadas a f.write por archivo se vuelven una sola pasada por la capa
+    # de I/O
+    parts = []
+    parts.append(f"📊 MOVIMIENTOS: {pdf_file.name}\n")
+    parts.append(f"{'='*80}\n\n")
+
+    # Tabla de movimientos
+    parts.append(f"{'#':<3} {'Fecha':<10} {'Comprobante':<12} {'Descripción':<30} {'Cuota':<8} {'Titular':<15} {'Monto':>12}\n")
+    parts.append("-" * 100 + "\n")
+
+    for i, mov in enumerate(movements, 1):
+        fecha_str = mov.fecha.strftime('%Y-%m-%d') if mov.fecha else ''
+        comprobante = mov.comprobante[:11]
+        descripcion = mov.descripcion[:29]
+        cuota = mov.cuota[:7]
+        titular = mov.titular[:14]
+
+        parts.append(f"{i:<3} {fecha_str:<10} {comprobante:<12} {descripcion:<30} "
+                     f"{cuota:<8} {titular:<15} ${mov.importe:>11,.2f}\n")
+
+    parts.append("-" * 100 + "\n")
+    parts.append(f"Total movimientos: {len(movements)}\n\n")
+
+    # Validación si está disponible
+    if resumen_info:
+        parts.append("\n📊 VALIDACIÓN:\n")
+        parts.append(f"{'Categoría':<25} {'Importe':>15}\n")
+        parts.append("-" * 42 + "\n")
+        parts.append(f"{'Saldo anterior':<25} ${resumen_info.get('saldo_anterior', 0):>12,.2f}\n")
+        parts.append(f"{'Total consumos':<25} ${resumen_info.get('total_consumos', 0):>12,.2f}\n")
+        parts.append(f"{'Bonificaciones':<25} ${resumen_info.get('bonificaciones', 0):>12,.2f}\n")
+        parts.append(f"{'Cargos bancarios':<25} ${resumen_info.get('cargos_bancarios', 0):>12,.2f}\n")
+        parts.append("-" * 42 + "\n")
+        parts.append(f"{'SALDO CALCULADO':<25} ${resumen_info.get('saldo_calculado', 0):>12,.2f}\n")
+        parts.append(f"{'Saldo oficial':<25} ${resumen_info.get('saldo_actual', 0):>12,.2f}\n")
+
+        if resumen_info.get('validacion_ok'):
+            parts.append(f"{'Estado':<25} ✅ Validación exitosa\n")
+        else:
+            diferencia = resumen_info.get('diferencia_validacion', 0)
+            parts.append(f"{'Diferencia':<25} ${diferencia:>12,.2f}\n")
+            parts.append(f"{'Estado':<25} ⚠️ Diferencia significativa\n")
+
+    with open(result_filename, 'w', encoding='utf-8', buffering=1024*1024) as f:
+        f.write(''.join(parts))
+
+def _process_one(pdf_file):
+    """
+    Worker de extracción para un PDF (corre en un proceso hijo)
+
+    Devuelve (pdf_file, movements, resumen_info, error) para que el
+    proceso principal imprima y guarde secuencialmente.
+    """
+    try:
+        extractor = PatagoniaExtractor()
+        movements = extractor.extract(pdf_file)
+        resumen_info = extractor.last_resumen_info if movements else None
+        return pdf_file, movements, resumen_info, None
+    except Exception as e:
+        return pdf_file, [], None, f"{e}\n{traceback.format_exc()}"
 
 def test_patagonia_extractor(specific_file=None):
     """Prueba el extractor de Patagonia"""
-    extractor = PatagoniaExtractor()
-    
     # Buscar PDFs (ajustar ruta relativa desde tests/)
     patagonia_folder = Path(__file__).parent.parent / "input" / "VISA_Patagonia"
     if not patagonia_folder.exists():
@@ -87,7 +125,11 @@ def test_patagonia_extractor(specific_file=None):
         
         pdf_files = [target_file]
     else:
-        pdf_files = sorted(patagonia_folder.glob("*.pdf"))
+        # os.scandir lista el directorio en una sola llamada y reutiliza la
+        # información de cada entrada, sin el stat extra por archivo de glob
+        with os.scandir(patagonia_folder) as entries:
+            pdf_files = sorted(patagonia_folder / e.name
+                               for e in entries if e.name.endswith('.pdf'))
         if not pdf_files:
             print(f"❌ No hay PDFs en {patagonia_folder}")
             return
@@ -96,53 +138,57 @@ def test_patagonia_extractor(specific_file=None):
     output_folder = Path(__file__).parent.parent / "debug" / "resultados"
     output_folder.mkdir(parents=True, exist_ok=True)
     
-    # Procesar archivos
+    # Procesar archivos: cada PDF es independiente y el parsing de
+    # pdfplumber es CPU-bound, así que con varios archivos la extracción
+    # se reparte en procesos; la impresión y el guardado quedan
+    # secuenciales en el proceso principal
     validation_results = []
-    
-    for pdf_file in pdf_files:
+
+    if len(pdf_files) > 1:
+        max_workers = min(len(pdf_files), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(_process_one, pdf_files)
+    else:
+        results = [_process_one(pdf_files[0])]
+
+    for pdf_file, movements, resumen_info, error in results:
         print(f"\n🔍 Procesando: {pdf_file.name}")
-        
-        try:
-            # Extraer movimientos
-            movements = extractor.extract(pdf_file)
-            
-            if not movements:
-                print("  ⚠️  No se encontraron movimientos")
-                continue
-            
-            print(f"  Movimientos: {len(movements)}")
-            
-            # Guardar resultados
-            resumen_info = extractor.last_resumen_info
-            save_movements_to_file(movements, pdf_file, output_folder, resumen_info)
-            
-            # Mostrar validación
-            if resumen_info:
-                validation_results.append({
-                    'archivo': pdf_file.name,
-                    'saldo_calculado': resumen_info.get('saldo_calculado', 0),
-                    'saldo_oficial': resumen_info.get('saldo_actual', 0),
-                    'validacion_ok': resumen_info.get('validacion_ok', False),
-                    'diferencia': resumen_info.get('diferencia_validacion', 0)
-                })
-                
-                print(f"\n  📊 VALIDACIÓN:")
-                print(f"  {'Categoría':<25} {'Importe':>15}")
-                print("  " + "-" * 42)
-                print(f"  {'Saldo anterior':<25} ${resumen_info.get('saldo_anterior', 0):>12,.2f}")
-                print(f"  {'Total consumos':<25} ${resumen_info.get('total_consumos', 0):>12,.2f}")
-                print(f"  {'Bonificaciones':<25} ${resumen_info.get('bonificaciones', 0):>12,.2f}")
-                print(f"  {'Cargos bancarios':<25} ${resumen_info.get('cargos_bancarios', 0):>12,.2f}")
-                print("  " + "-" * 42)
-                print(f"  {'SALDO CALCULADO':<25} ${resumen_info.get('saldo_calculado', 0):>12,.2f}")
-                print(f"  {'Saldo oficial':<25} ${resumen_info.get('saldo_actual', 0):>12,.2f}")
-                print(f"  {'Estado':<25} {'✅ Validación exitosa' if resumen_info.get('validacion_ok') else '⚠️ Diferencia significativa'}")
-                
-        except Exception as e:
-            print(f"  ❌ Error: {e}")
-            import traceback
-            traceback.print_exc()
-    
+
+        if error:
+            print(f"  ❌ Error: {error}")
+            continue
+
+        if not movements:
+            print("  ⚠️  No se encontraron movimientos")
+            continue
+
+        print(f"  Movimientos: {len(movements)}")
+
+        # Guardar resultados
+        save_movements_to_file(movements, pdf_file, output_folder, resumen_info)
+
+        # Mostrar validación
+        if resumen_info:
+            validation_results.append(ValResult(
+                archivo=pdf_file.name,
+                saldo_calculado=resumen_info.get('saldo_calculado', 0),
+                saldo_oficial=resumen_info.get('saldo_actual', 0),
+                validacion_ok=resumen_info.get('validacion_ok', False),
+                diferencia=resumen_info.get('diferencia_validacion', 0)
+            ))
+
+            print(f"\n  📊 VALIDACIÓN:")
+            print(f"  {'Categoría':<25} {'Importe':>15}")
+            print("  " + "-" * 42)
+            print(f"  {'Saldo anterior':<25} ${resumen_info.get('saldo_anterior', 0):>12,.2f}")
+            print(f"  {'Total consumos':<25} ${resumen_info.get('total_consumos', 0):>12,.2f}")
+            print(f"  {'Bonificaciones':<25} ${resumen_info.get('bonificaciones', 0):>12,.2f}")
+            print(f"  {'Cargos bancarios':<25} ${resumen_info.get('cargos_bancarios', 0):>12,.2f}")
+            print("  " + "-" * 42)
+            print(f"  {'SALDO CALCULADO':<25} ${resumen_info.get('saldo_calculado', 0):>12,.2f}")
+            print(f"  {'Saldo oficial':<25} ${resumen_info.get('saldo_actual', 0):>12,.2f}")
+            print(f"  {'Estado':<25} {'✅ Validación exitosa' if resumen_info.get('validacion_ok') else '⚠️ Diferencia significativa'}")
+
     # Resumen final
     if len(pdf_files) > 1 and validation_results:
         print(f"\n{'='*60}")
@@ -156,10 +202,10 @@ def test_patagonia_extractor(specific_file=None):
         print("  " + "-" * 82)
         
         for result in validation_results:
-            archivo = result['archivo'][:34]
-            print(f"  {archivo:<35} ${result['saldo_calculado']:>12,.2f} "
-                  f"${result['saldo_oficial']:>12,.2f} "
-                  f"{'✅' if result['validacion_ok'] else '⚠️':>15}")
+            archivo = result.archivo[:34]
+            print(f"  {archivo:<35} ${result.saldo_calculado:>12,.2f} "
+                  f"${result.saldo_oficial:>12,.2f} "
+                  f"{'✅' if result.validacion_ok else '⚠️':>15}")
         
         print(f"{'='*60}")
 
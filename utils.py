@@ -2,6 +2,7 @@
 Utilidades para procesamiento de PDFs y fechas
 """
 import re
+import functools
 import logging
 from datetime import datetime
 from typing import Optional, List
@@ -9,6 +10,29 @@ from config import MESES_ES, DATE_FORMATS, DEBUG_MODE
 
 logger = logging.getLogger(__name__)
 
+# Alternancia de meses en español compilada una vez: normalizar con un solo
+# sub en lugar de un str.replace por mes (12+ pasadas sobre el string).
+# Los nombres largos van primero para que "marzo" no matchee solo "mar".
+_MONTH_RE = re.compile('|'.join(re.escape(k) for k in sorted(MESES_ES, key=len, reverse=True)))
+
+# Tupla inmutable de formatos por defecto, apta como clave de lru_cache
+_DATE_FORMATS = tuple(DATE_FORMATS)
+
+# Patrones de limpieza de descripciones, compilados una vez
+_RE_CUOTA = re.compile(r'\s+Cuota\s+\d+/\d+\s*$')
+_RE_BAD = re.compile(r'[^\w\s\-\.\/*$%]+')
+_RE_WS = re.compile(r'\s+')
+
+# Tabla de traducción que borra todo salvo dígitos, punto y coma:
+# str.translate es bastante más rápido que el motor de regex para este
+# filtrado caracter a caracter en el camino numérico caliente.
+# La tabla solo cubre Latin-1; lo que quede fuera de ASCII después de
+# traducir se limpia con _RE_NO_NUM como fallback.
+_AMOUNT_DELETE = str.maketrans('', '', ''.join(
+    chr(i) for i in range(256) if chr(i) not in '0123456789.,'
+))
+_RE_NO_NUM = re.compile(r'[^\d.,]')
+
 def debug_log(message: str):
     """
     Log condicional solo si DEBUG_MODE está activo
@@ -31,10 +55,23 @@ def warning_log(message: str):
 
 def normalize_spanish_month(text: str) -> str:
     """Normaliza los meses en español a inglés para parsing"""
-    text_lower = text.lower()
-    for es_month, en_month in MESES_ES.items():
-        text_lower = text_lower.replace(es_month, en_month)
-    return text_lower
+    return _MONTH_RE.sub(lambda m: MESES_ES[m.group(0)], text.lower())
+
+@functools.lru_cache(maxsize=2048)
+def _parse_date_cached(date_str: str, formats: tuple) -> Optional[datetime]:
+    """
+    Loop de strptime sobre los formatos, memoizado por (fecha, formatos).
+    Los resúmenes repiten las mismas fechas decenas de veces; el cache
+    convierte esas repeticiones en un lookup en lugar de re-parsear.
+    """
+    for fmt in formats:
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+
+    return None
+
 
 def parse_date(date_str: str, formats: List[str] = None) -> Optional[datetime]:
     """
@@ -42,23 +79,17 @@ def parse_date(date_str: str, formats: List[str] = None) -> Optional[datetime]:
     """
     if not date_str or not isinstance(date_str, str):
         return None
-        
+
     date_str = date_str.strip()
     if not date_str:
         return None
-    
+
     # Normalizar meses en español
     date_str = normalize_spanish_month(date_str)
-    
-    formats_to_try = formats or DATE_FORMATS
-    
-    for fmt in formats_to_try:
-        try:
-            return datetime.strptime(date_str, fmt)
-        except ValueError:
-            continue
-    
-    return None
+
+    formats_to_try = tuple(formats) if formats else _DATE_FORMATS
+
+    return _parse_date_cached(date_str, formats_to_try)
 
 def extract_amount(amount_str: str) -> Optional[float]:
     """
@@ -82,8 +113,12 @@ def extract_amount(amount_str: str) -> Optional[float]:
         cleaned = cleaned[:-1].strip()
     
     # Remover caracteres no numéricos excepto puntos y comas
-    cleaned = re.sub(r'[^\d.,]', '', cleaned)
-    
+    cleaned = cleaned.translate(_AMOUNT_DELETE)
+    if not cleaned.isascii():
+        # Caracteres fuera de Latin-1 (€, espacios unicode, etc.) no están
+        # en la tabla de traducción; se eliminan con la regex
+        cleaned = _RE_NO_NUM.sub('', cleaned)
+
     if not cleaned:
         return None
     
@@ -116,17 +151,12 @@ def clean_description(text: str) -> str:
     """
     if not text:
         return ""
-    
-    # Remover múltiples espacios
-    text = re.sub(r'\s+', ' ', text.strip())
-    
+
     # Remover información de cuotas redundante al final
-    text = re.sub(r'\s+Cuota\s+\d+/\d+\s*$', '', text)
-    
+    text = _RE_CUOTA.sub('', text)
+
     # Remover caracteres especiales innecesarios pero mantener * y otros importantes
-    text = re.sub(r'[^\w\s\-\.\/*$%]', ' ', text)
-    
-    # Limpiar espacios nuevamente
-    text = re.sub(r'\s+', ' ', text.strip())
-    
-    return text.strip()
\ No newline at end of file
+    text = _RE_BAD.sub(' ', text)
+
+    # Colapsar espacios una única vez al final
+    return _RE_WS.sub(' ', text).strip()
\ No newline at end of file